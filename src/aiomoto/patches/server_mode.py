@@ -18,6 +18,9 @@ from botocore.session import Session as BotocoreSession
 from aiomoto.exceptions import AutoEndpointError
 
 
+_S3_URL_PREFIXES = ("s3://", "s3a://", "s3n://")
+
+
 class AutoEndpointMode(str, Enum):
     FORCE = "force"
     IF_MISSING = "if_missing"
@@ -50,7 +53,7 @@ def _should_inject(mode: AutoEndpointMode, endpoint_url: str | None) -> bool:
 def _is_s3_url(path: object) -> bool:
     if not isinstance(path, str):
         return False
-    return path.startswith(("s3://", "s3a://", "s3n://"))
+    return path.startswith(_S3_URL_PREFIXES)
 
 
 def _is_s3_source(source: object) -> bool:
@@ -102,10 +105,10 @@ def _pandas_client_kwargs(storage_options: dict[str, Any]) -> dict[str, Any] | N
 def _storage_options_has_endpoint(storage_options: dict[str, Any]) -> bool:
     if storage_options.get("endpoint_url") is not None:
         return True
-    client_kwargs = _pandas_client_kwargs(storage_options)
-    if client_kwargs is None:
-        return True
-    return client_kwargs.get("endpoint_url") is not None
+    client_kwargs = storage_options.get("client_kwargs")
+    if isinstance(client_kwargs, dict):
+        return client_kwargs.get("endpoint_url") is not None
+    return client_kwargs is not None
 
 
 def _apply_pandas_storage_options(
@@ -180,15 +183,6 @@ def _apply_polars_storage_options(
     return options
 
 
-def _polars_fsspec_has_endpoint(storage_options: dict[str, Any]) -> bool:
-    if storage_options.get("endpoint_url") is not None:
-        return True
-    client_kwargs = storage_options.get("client_kwargs")
-    if isinstance(client_kwargs, dict):
-        return client_kwargs.get("endpoint_url") is not None
-    return client_kwargs is not None
-
-
 def _apply_polars_fsspec_storage_options(
     storage_options: dict[str, Any] | None, endpoint: str, mode: AutoEndpointMode
 ) -> dict[str, Any] | None:
@@ -197,7 +191,7 @@ def _apply_polars_fsspec_storage_options(
     if storage_options is None:
         options: dict[str, Any] = {}
     else:
-        if mode is AutoEndpointMode.IF_MISSING and _polars_fsspec_has_endpoint(
+        if mode is AutoEndpointMode.IF_MISSING and _storage_options_has_endpoint(
             storage_options
         ):
             return storage_options
@@ -316,9 +310,9 @@ def _wrap_pandas_get_filepath(
     def _get_filepath_or_buffer(*args: Any, **kwargs: Any) -> Any:
         bound = signature.bind(*args, **kwargs)
         bound.apply_defaults()
-        endpoint, mode = get_settings()
         path = bound.arguments.get("filepath_or_buffer")
         if _is_s3_url(path):
+            endpoint, mode = get_settings()
             bound.arguments["storage_options"] = _apply_pandas_storage_options(
                 bound.arguments.get("storage_options"), endpoint, mode
             )
@@ -336,14 +330,12 @@ def _wrap_pandas_get_path(
     def _get_path_or_handle(*args: Any, **kwargs: Any) -> Any:
         bound = signature.bind(*args, **kwargs)
         bound.apply_defaults()
-        endpoint, mode = get_settings()
         path = bound.arguments.get("path_or_handle") or bound.arguments.get("path")
-        if _is_s3_url(path):
-            fs = bound.arguments.get("fs")
-            if fs is None:
-                bound.arguments["storage_options"] = _apply_pandas_storage_options(
-                    bound.arguments.get("storage_options"), endpoint, mode
-                )
+        if _is_s3_url(path) and bound.arguments.get("fs") is None:
+            endpoint, mode = get_settings()
+            bound.arguments["storage_options"] = _apply_pandas_storage_options(
+                bound.arguments.get("storage_options"), endpoint, mode
+            )
         return original(*bound.args, **bound.kwargs)
 
     return _get_path_or_handle
@@ -362,6 +354,7 @@ class ServerModePatcher:
         self._original_s3fs_init: Callable[..., Any] | None = None
         self._original_pandas_get_filepath: Callable[..., Any] | None = None
         self._original_pandas_get_path: Callable[..., Any] | None = None
+        self._pandas_targets: tuple[object, object] | None = None
         self._original_polars_functions: dict[str, Callable[..., Any]] | None = None
         self._original_polars_df_methods: dict[str, Callable[..., Any]] | None = None
         self._original_polars_lazy_methods: dict[str, Callable[..., Any]] | None = None
@@ -520,7 +513,7 @@ class ServerModePatcher:
         self._original_s3fs_init = None
 
     def _patch_pandas(self) -> None:
-        if self._original_pandas_get_filepath is not None:
+        if self._pandas_targets is not None:
             return
         modules = _pandas_modules()
         if modules is None:
@@ -528,32 +521,33 @@ class ServerModePatcher:
         pandas_common, pandas_parquet = modules
         filepath_name = "_get_filepath_or_buffer"
         path_name = "_get_path_or_handle"
-        self._original_pandas_get_filepath = getattr(pandas_common, filepath_name)
-        self._original_pandas_get_path = getattr(pandas_parquet, path_name)
+        original_get_filepath = getattr(pandas_common, filepath_name)
+        original_get_path = getattr(pandas_parquet, path_name)
+        self._original_pandas_get_filepath = original_get_filepath
+        self._original_pandas_get_path = original_get_path
 
         def _get_settings() -> tuple[str, AutoEndpointMode]:
             return _require_server_settings(self._endpoint, self._mode)
 
         wrapped_get_filepath = _wrap_pandas_get_filepath(
-            self._original_pandas_get_filepath, _get_settings
-        )
-        wrapped_get_path = _wrap_pandas_get_path(
-            self._original_pandas_get_path, _get_settings
+            original_get_filepath, _get_settings
         )
+        wrapped_get_path = _wrap_pandas_get_path(original_get_path, _get_settings)
+        self._pandas_targets = modules
         setattr(pandas_common, filepath_name, wrapped_get_filepath)
         setattr(pandas_parquet, path_name, wrapped_get_path)
 
     def _restore_pandas(self) -> None:
-        if self._original_pandas_get_filepath is None:
+        if self._pandas_targets is None:
             return
-        pandas_common = importlib.import_module("pandas.io.common")
-        pandas_parquet = importlib.import_module("pandas.io.parquet")
+        pandas_common, pandas_parquet = self._pandas_targets
         filepath_name = "_get_filepath_or_buffer"
         path_name = "_get_path_or_handle"
         setattr(pandas_common, filepath_name, self._original_pandas_get_filepath)
         setattr(pandas_parquet, path_name, self._original_pandas_get_path)
         self._original_pandas_get_filepath = None
         self._original_pandas_get_path = None
+        self._pandas_targets = None
 
     def _patch_polars(self) -> None:
         if self._original_polars_functions is not None:
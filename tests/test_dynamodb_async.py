@@ -11,11 +11,14 @@ from aiomoto import mock_aws
 
 AWS_REGION = "us-west-2"
 
+_SESSION = AioSession()
+_AIOBOTO3_SESSION = aioboto3.Session()
+
 
 @pytest.mark.asyncio
 async def test_client_create_describe_and_crud_shared_with_boto3() -> None:
     with mock_aws():
-        async with AioSession().create_client(
+        async with _SESSION.create_client(
             "dynamodb", region_name=AWS_REGION
         ) as dynamodb:
             await dynamodb.create_table(
@@ -54,7 +57,7 @@ async def test_dynamodb_backend_isolated_by_region() -> None:
             BillingMode="PAY_PER_REQUEST",
         )
 
-        async with AioSession().create_client(
+        async with _SESSION.create_client(
             "dynamodb", region_name=AWS_REGION
         ) as dynamodb:
             with pytest.raises(ClientError) as exc:
@@ -66,7 +69,7 @@ async def test_dynamodb_backend_isolated_by_region() -> None:
 @pytest.mark.asyncio
 async def test_aioboto3_resource_supports_sort_keys_and_indexes() -> None:
     with mock_aws():
-        async with aioboto3.Session().resource(
+        async with _AIOBOTO3_SESSION.resource(
             "dynamodb", region_name=AWS_REGION
         ) as dynamodb:
             table = await dynamodb.create_table(
@@ -141,7 +144,7 @@ async def test_sync_put_visible_to_async_client() -> None:
         )
         sync.put_item(TableName="bridge", Item={"pk": {"S": "from-sync"}})
 
-        async with AioSession().create_client(
+        async with _SESSION.create_client(
             "dynamodb", region_name=AWS_REGION
         ) as dynamodb:
             item = await dynamodb.get_item(
@@ -162,7 +165,7 @@ async def test_sync_put_visible_to_async_resource() -> None:
         )
         sync.put_item(TableName="bridge-res", Item={"pk": {"S": "sync-val"}})
 
-        async with aioboto3.Session().resource(
+        async with _AIOBOTO3_SESSION.resource(
             "dynamodb", region_name=AWS_REGION
         ) as dynamodb:
             table = await dynamodb.Table("bridge-res")
@@ -9,15 +9,13 @@ from aiomoto import mock_aws
 REGION = "us-east-1"
 ACCOUNT_ID = "123456789012"
 
-
-def _session() -> aioboto3.Session:
-    return aioboto3.Session()
+_SESSION = aioboto3.Session()
 
 
 @pytest.mark.asyncio
 async def test_put_rule_async() -> None:
     with mock_aws():
-        async with _session().client("events", region_name=REGION) as events:
+        async with _SESSION.client("events", region_name=REGION) as events:
             response = await events.put_rule(
                 Name="my-schedule",
                 ScheduleExpression="rate(5 minutes)",
@@ -34,7 +32,7 @@ async def test_put_rule_with_event_bus_arn_async() -> None:
     bus_name = "custom-bus"
     bus_arn = f"arn:aws:events:{REGION}:{ACCOUNT_ID}:event-bus/{bus_name}"
     with mock_aws():
-        async with _session().client("events", region_name=REGION) as events:
+        async with _SESSION.client("events", region_name=REGION) as events:
             await events.create_event_bus(Name=bus_name)
             response = await events.put_rule(
                 Name="bus-rule",
@@ -50,7 +48,7 @@ async def test_put_rule_with_event_bus_arn_async() -> None:
 @pytest.mark.asyncio
 async def test_list_and_describe_rules_async() -> None:
     with mock_aws():
-        async with _session().client("events", region_name=REGION) as events:
+        async with _SESSION.client("events", region_name=REGION) as events:
             await events.put_rule(Name="one", ScheduleExpression="rate(1 minute)")
             await events.put_rule(Name="two", EventPattern='{"detail-type": ["test"]}')
 
@@ -11,9 +11,11 @@ from aiomoto import mock_aws
 
 FAKE_TAGS = {"TestKey": "TestValue", "TestKey2": "TestValue2"}
 
+_SESSION = aioboto3.Session()
+
 
 def _client(region: str) -> AbstractAsyncContextManager[Any]:
-    return aioboto3.Session().client("kafka", region_name=region)
+    return _SESSION.client("kafka", region_name=region)
 
 
 @mock_aws
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import aioboto3
 from aiobotocore.session import AioSession
 import boto3
@@ -11,20 +13,22 @@ from aiomoto import mock_aws
 
 AWS_REGION = "us-east-1"
 
+_SESSION = AioSession()
+_AIOBOTO3_SESSION = aioboto3.Session()
+_BOTO3_SESSION = boto3.Session()
+
 
 @pytest.mark.asyncio
 async def test_bucket_visibility_between_sync_and_async_clients() -> None:
     with mock_aws():
-        s3_sync = boto3.client("s3", region_name=AWS_REGION)
+        s3_sync = _BOTO3_SESSION.client("s3", region_name=AWS_REGION)
         s3_sync.create_bucket(Bucket="mybucket")
 
-        session = AioSession()
-        async with session.create_client("s3", region_name=AWS_REGION) as s3_async:
+        async with _SESSION.create_client("s3", region_name=AWS_REGION) as s3_async:
             response = await s3_async.list_buckets()
             bucket_names = [bucket["Name"] for bucket in response["Buckets"]]
             assert "mybucket" in bucket_names
 
-        async with session.create_client("s3", region_name=AWS_REGION) as s3_async:
             await s3_async.create_bucket(Bucket="async-bucket")
 
         bucket_names_sync = [
@@ -36,15 +40,14 @@ async def test_bucket_visibility_between_sync_and_async_clients() -> None:
 @pytest.mark.asyncio
 async def test_sync_boto3_to_async_aioboto3_visibility() -> None:
     with mock_aws():
-        s3_sync = boto3.client("s3", region_name=AWS_REGION)
+        s3_sync = _BOTO3_SESSION.client("s3", region_name=AWS_REGION)
         s3_sync.create_bucket(Bucket="sync-bucket")
 
-        async with aioboto3.Session().client("s3", region_name=AWS_REGION) as s3_async:
+        async with _AIOBOTO3_SESSION.client("s3", region_name=AWS_REGION) as s3_async:
             buckets = await s3_async.list_buckets()
             names = [bucket["Name"] for bucket in buckets["Buckets"]]
             assert "sync-bucket" in names
 
-        async with aioboto3.Session().client("s3", region_name=AWS_REGION) as s3_async:
             await s3_async.create_bucket(Bucket="aio-bucket")
 
         bucket_names_sync = [
@@ -57,19 +60,16 @@ async def test_sync_boto3_to_async_aioboto3_visibility() -> None:
 async def test_resource_visibility_between_sync_and_async() -> None:
     with mock_aws():
         # sync create via resource
-        s3_res_sync = boto3.resource("s3", region_name=AWS_REGION)
+        s3_res_sync = _BOTO3_SESSION.resource("s3", region_name=AWS_REGION)
         s3_res_sync.create_bucket(Bucket="res-sync")
 
-        async with aioboto3.Session().resource(
+        async with _AIOBOTO3_SESSION.resource(
             "s3", region_name=AWS_REGION
         ) as s3_res_async:
             names = [bucket.name async for bucket in s3_res_async.buckets.all()]
             assert "res-sync" in names
 
-        # async create via resource
-        async with aioboto3.Session().resource(
-            "s3", region_name=AWS_REGION
-        ) as s3_res_async:
+            # async create via resource
             bucket = await s3_res_async.Bucket("res-async")
             await bucket.create()
 
@@ -80,8 +80,7 @@ async def test_resource_visibility_between_sync_and_async() -> None:
 @pytest.mark.asyncio
 async def test_missing_bucket_raises_client_error() -> None:
     with mock_aws():
-        session = AioSession()
-        async with session.create_client("s3", region_name=AWS_REGION) as s3_async:
+        async with _SESSION.create_client("s3", region_name=AWS_REGION) as s3_async:
             with pytest.raises(ClientError) as exc_info:
                 await s3_async.get_object(Bucket="missing-bucket", Key="the-key")
 
@@ -93,11 +92,10 @@ async def test_missing_bucket_raises_client_error() -> None:
 @pytest.mark.asyncio
 async def test_async_client_empty_object_visible_to_boto3() -> None:
     with mock_aws():
-        s3_sync = boto3.client("s3", region_name=AWS_REGION)
+        s3_sync = _BOTO3_SESSION.client("s3", region_name=AWS_REGION)
         s3_sync.create_bucket(Bucket="async-bucket")
 
-        session = AioSession()
-        async with session.create_client("s3", region_name=AWS_REGION) as s3_async:
+        async with _SESSION.create_client("s3", region_name=AWS_REGION) as s3_async:
             await s3_async.put_object(Bucket="async-bucket", Key="empty-key", Body=b"")
             resp = await s3_async.get_object(Bucket="async-bucket", Key="empty-key")
             assert resp["ContentLength"] == 0
@@ -111,11 +109,10 @@ async def test_async_client_empty_object_visible_to_boto3() -> None:
 @pytest.mark.asyncio
 async def test_async_overwrite_and_metadata_shared() -> None:
     with mock_aws():
-        s3_sync = boto3.client("s3", region_name=AWS_REGION)
+        s3_sync = _BOTO3_SESSION.client("s3", region_name=AWS_REGION)
         s3_sync.create_bucket(Bucket="meta-bucket")
 
-        session = AioSession()
-        async with session.create_client("s3", region_name=AWS_REGION) as s3_async:
+        async with _SESSION.create_client("s3", region_name=AWS_REGION) as s3_async:
             await s3_async.put_object(
                 Bucket="meta-bucket",
                 Key="the-key",
@@ -140,32 +137,31 @@ async def test_async_overwrite_and_metadata_shared() -> None:
 @pytest.mark.asyncio
 async def test_sync_put_visible_to_async_clients_and_resources() -> None:
     with mock_aws():
-        s3_sync = boto3.client("s3", region_name=AWS_REGION)
+        s3_sync = _BOTO3_SESSION.client("s3", region_name=AWS_REGION)
         s3_sync.create_bucket(Bucket="sync-to-async")
         s3_sync.put_object(
             Bucket="sync-to-async", Key="hello.txt", Body=b"sync-wrote-this"
         )
 
-        session = AioSession()
-        async with session.create_client("s3", region_name=AWS_REGION) as s3_async:
-            resp = await s3_async.get_object(Bucket="sync-to-async", Key="hello.txt")
-            assert await resp["Body"].read() == b"sync-wrote-this"
-
-        async with aioboto3.Session().resource(
-            "s3", region_name=AWS_REGION
-        ) as s3_res_async:
+        async with (
+            _SESSION.create_client("s3", region_name=AWS_REGION) as s3_async,
+            _AIOBOTO3_SESSION.resource("s3", region_name=AWS_REGION) as s3_res_async,
+        ):
             obj = await s3_res_async.Object("sync-to-async", "hello.txt")
-            fetched = await obj.get()
+            resp, fetched = await asyncio.gather(
+                s3_async.get_object(Bucket="sync-to-async", Key="hello.txt"), obj.get()
+            )
+            assert await resp["Body"].read() == b"sync-wrote-this"
             assert await fetched["Body"].read() == b"sync-wrote-this"
 
 
 @pytest.mark.asyncio
 async def test_resource_streaming_body_iteration() -> None:
     with mock_aws():
-        s3_sync = boto3.client("s3", region_name=AWS_REGION)
+        s3_sync = _BOTO3_SESSION.client("s3", region_name=AWS_REGION)
         s3_sync.create_bucket(Bucket="stream-bucket")
 
-        async with aioboto3.Session().resource(
+        async with _AIOBOTO3_SESSION.resource(
             "s3", region_name=AWS_REGION
         ) as s3_resource:
             obj = await s3_resource.Object("stream-bucket", "stream-key")
@@ -185,13 +181,12 @@ async def test_resource_streaming_body_iteration() -> None:
 @pytest.mark.asyncio
 async def test_async_client_listing_preserves_key_names() -> None:
     with mock_aws():
-        s3_sync = boto3.client("s3", region_name=AWS_REGION)
+        s3_sync = _BOTO3_SESSION.client("s3", region_name=AWS_REGION)
         s3_sync.create_bucket(Bucket="list-bucket")
 
         odd_key = "6T7\x159\x12\r\x08.txt"
 
-        session = AioSession()
-        async with session.create_client("s3", region_name=AWS_REGION) as s3_async:
+        async with _SESSION.create_client("s3", region_name=AWS_REGION) as s3_async:
             await s3_async.put_object(Bucket="list-bucket", Key=odd_key, Body=b"")
 
             resp = await s3_async.list_objects(Bucket="list-bucket")
@@ -208,19 +203,18 @@ async def test_async_client_listing_preserves_key_names() -> None:
 @pytest.mark.asyncio
 async def test_async_listing_with_prefix_and_encoding_type() -> None:
     with mock_aws():
-        s3_sync = boto3.client("s3", region_name=AWS_REGION)
+        s3_sync = _BOTO3_SESSION.client("s3", region_name=AWS_REGION)
         s3_sync.create_bucket(Bucket="prefix-bucket")
 
         name = "example/file.text"
 
-        async with aioboto3.Session().resource(
+        async with _AIOBOTO3_SESSION.resource(
             "s3", region_name=AWS_REGION
         ) as s3_res_async:
             obj = await s3_res_async.Object("prefix-bucket", name)
             await obj.put(Body=b"")
 
-        session = AioSession()
-        async with session.create_client("s3", region_name=AWS_REGION) as s3_async:
+        async with _SESSION.create_client("s3", region_name=AWS_REGION) as s3_async:
             resp = await s3_async.list_objects(
                 Bucket="prefix-bucket",
                 Prefix="example/",
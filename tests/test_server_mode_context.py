@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 import json
 import os
 import pathlib
-import sys
+import socket
 import time
-from urllib import error, parse, request
+from urllib import parse, request
 
 import pytest
 from pytest_mock import MockerFixture
@@ -27,19 +28,23 @@ def _assert_server_up(endpoint: str) -> None:
 
 
 def _assert_server_down(endpoint: str) -> None:
+    parsed = parse.urlparse(endpoint)
+    address = (parsed.hostname or "", parsed.port or 80)
+    delay = 0.005
     for _ in range(10):
-        if not _server_responding(endpoint):
+        if not _server_responding(address):
             return
-        time.sleep(0.1)
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
     raise AssertionError("Moto server still responding after shutdown")
 
 
-def _server_responding(endpoint: str) -> bool:
+def _server_responding(address: tuple[str, int]) -> bool:
     try:
-        with request.urlopen(f"{endpoint}/moto-api", timeout=0.5):  # noqa: S310
-            return True
-    except (error.URLError, OSError):
+        socket.create_connection(address, 0.2).close()
+    except OSError:
         return False
+    return True
 
 
 def test_server_mode_starts_server_and_healthchecks() -> None:
@@ -73,10 +78,10 @@ def test_server_mode_nested_mismatch_rolls_back() -> None:
     _assert_server_down(endpoint)
 
 
-def test_server_mode_preserves_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "orig")
-    monkeypatch.delenv("AWS_SECRET_ACCESS_KEY", raising=False)
-    monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
+def test_server_mode_preserves_env(set_env: Callable[..., None]) -> None:
+    set_env(
+        AWS_ACCESS_KEY_ID="orig", AWS_SECRET_ACCESS_KEY=None, AWS_DEFAULT_REGION=None
+    )
     with mock_aws(server_mode=True):
         assert os.environ["AWS_ACCESS_KEY_ID"] == "orig"
         assert os.environ["AWS_SECRET_ACCESS_KEY"] == "test"  # noqa: S105
@@ -87,17 +92,14 @@ def test_server_mode_preserves_env(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 def test_server_mode_dependency_failure_restores_env(
-    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    set_env: Callable[..., None], mocker: MockerFixture
 ) -> None:
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "orig")
-    monkeypatch.delenv("AWS_SECRET_ACCESS_KEY", raising=False)
-    monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
-
-    def _raise_missing() -> None:
-        raise RuntimeError("missing deps")
-
+    set_env(
+        AWS_ACCESS_KEY_ID="orig", AWS_SECRET_ACCESS_KEY=None, AWS_DEFAULT_REGION=None
+    )
     mocker.patch(
-        "aiomoto.context._ensure_server_dependencies", side_effect=_raise_missing
+        "aiomoto.context._ensure_server_dependencies",
+        side_effect=RuntimeError("missing deps"),
     )
 
     with pytest.raises(RuntimeError, match="missing deps"):
@@ -154,24 +156,19 @@ def test_assert_server_up_rejects_invalid_scheme() -> None:
 
 
 def test_assert_server_down_raises_when_server_stays_up(mocker: MockerFixture) -> None:
-    mocker.patch.object(sys.modules[__name__], "_server_responding", return_value=True)
+    mocker.patch(f"{__name__}._server_responding", return_value=True)
     mocker.patch.object(time, "sleep")
     with pytest.raises(AssertionError, match="still responding"):
         _assert_server_down("http://example.com")
 
 
 def test_server_responding_returns_true(mocker: MockerFixture) -> None:
-    class _Response:
-        def __enter__(self) -> _Response:
-            return self
-
-        def __exit__(
-            self,
-            exc_type: type[BaseException] | None,
-            exc: BaseException | None,
-            tb: object | None,
-        ) -> None:
-            return None
-
-    mocker.patch.object(request, "urlopen", return_value=_Response())
-    assert _server_responding("http://example.com") is True
+    connect = mocker.patch.object(socket, "create_connection")
+    assert _server_responding(("example.com", 5000)) is True
+    connect.assert_called_once_with(("example.com", 5000), 0.2)
+    connect.return_value.close.assert_called_once_with()
+
+
+def test_server_responding_returns_false_when_refused(mocker: MockerFixture) -> None:
+    mocker.patch.object(socket, "create_connection", side_effect=ConnectionRefusedError)
+    assert _server_responding(("example.com", 5000)) is False
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 import sys
 import sysconfig
 from types import ModuleType
+from typing import Protocol
 
+from aiobotocore.session import AioSession
+from botocore.session import Session as BotocoreSession
 import pytest
 from pytest_mock import MockerFixture
 
@@ -20,7 +24,6 @@ from aiomoto.patches.server_mode import (
     _merge_path_style,
     _pandas_client_kwargs,
     _pandas_modules,
-    _polars_fsspec_has_endpoint,
     _polars_modules,
     _polars_storage_options_has_endpoint,
     _require_server_settings,
@@ -34,46 +37,191 @@ from aiomoto.patches.server_mode import (
 )
 
 
+_FREE_THREADED = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
 def _skip_if_free_threaded() -> None:
-    if sysconfig.get_config_var("Py_GIL_DISABLED"):
+    if _FREE_THREADED:
         pytest.skip("pandas patching disabled on free-threaded builds")
 
 
-def test_default_region_prefers_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("AWS_REGION", raising=False)
-    monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
-    assert _default_region() == "us-east-1"
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-west-2")
-    assert _default_region() == "us-west-2"
-    monkeypatch.setenv("AWS_REGION", "eu-west-1")
-    assert _default_region() == "eu-west-1"
+# Requesting monkeypatch makes this teardown run before the stub sys.modules go.
+@pytest.fixture
+def patcher(monkeypatch: pytest.MonkeyPatch) -> Iterator[ServerModePatcher]:
+    patcher = ServerModePatcher()
+    yield patcher
+    patcher._restore_polars()
+    patcher._restore_pandas()
+    patcher._restore_s3fs()
+    patcher._restore_aiobotocore()
+    patcher._restore_botocore()
 
 
-def test_default_creds_prefers_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "key")
-    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "token")
-    assert _default_creds() == ("key", "secret", "token")
+class _FakeS3FileSystem:  # noqa: B903
+    def __init__(
+        self,
+        *,
+        anon: bool | None = None,
+        endpoint_url: str | None = None,
+        client_kwargs: dict[str, object] | None = None,
+        config_kwargs: dict[str, object] | None = None,
+        use_ssl: bool | None = None,
+    ) -> None:
+        self.anon = anon
+        self.endpoint_url = endpoint_url
+        self.client_kwargs = client_kwargs
+        self.config_kwargs = config_kwargs
+        self.use_ssl = use_ssl
+
+
+@pytest.fixture
+def fake_s3fs_core(
+    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> ModuleType:
+    s3fs_core = ModuleType("s3fs.core")
+    attr_name = "S3FileSystem"
+    setattr(s3fs_core, attr_name, _FakeS3FileSystem)
+    monkeypatch.setitem(sys.modules, "s3fs", ModuleType("s3fs"))
+    monkeypatch.setitem(sys.modules, "s3fs.core", s3fs_core)
+    mocker.patch(
+        "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=object()
+    )
+    return s3fs_core
+
+
+class _InstallPolars(Protocol):
+    def __call__(self, **attrs: object) -> ModuleType: ...
+
+
+@pytest.fixture
+def install_polars(monkeypatch: pytest.MonkeyPatch) -> _InstallPolars:
+    def _install(**attrs: object) -> ModuleType:
+        polars_module = ModuleType("polars")
+        for name, value in attrs.items():
+            setattr(polars_module, name, value)
+        monkeypatch.setitem(sys.modules, "polars", polars_module)
+        return polars_module
+
+    return _install
+
 
+def _fake_get_filepath_or_buffer(
+    filepath_or_buffer: object,
+    encoding: str = "utf-8",
+    compression: object | None = None,
+    mode: str = "r",
+    storage_options: dict[str, object] | None = None,
+) -> dict[str, object] | None:
+    return storage_options
 
-def test_should_inject_modes() -> None:
-    assert _should_inject(AutoEndpointMode.DISABLED, None) is False
-    assert _should_inject(AutoEndpointMode.FORCE, "http://x") is True
-    assert _should_inject(AutoEndpointMode.IF_MISSING, None) is True
-    assert _should_inject(AutoEndpointMode.IF_MISSING, "http://x") is False
+
+def _fake_get_path_or_handle(
+    path_or_handle: object,
+    fs: object | None,
+    mode: str,
+    storage_options: dict[str, object] | None = None,
+) -> dict[str, object] | None:
+    return storage_options
+
+
+@pytest.fixture
+def fake_pandas_io(
+    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+) -> tuple[ModuleType, ModuleType]:
+    pandas_common = ModuleType("pandas.io.common")
+    pandas_parquet = ModuleType("pandas.io.parquet")
+    filepath_name = "_get_filepath_or_buffer"
+    path_name = "_get_path_or_handle"
+    setattr(pandas_common, filepath_name, _fake_get_filepath_or_buffer)
+    setattr(pandas_parquet, path_name, _fake_get_path_or_handle)
+    monkeypatch.setitem(sys.modules, "pandas", ModuleType("pandas"))
+    monkeypatch.setitem(sys.modules, "pandas.io", ModuleType("pandas.io"))
+    monkeypatch.setitem(sys.modules, "pandas.io.common", pandas_common)
+    monkeypatch.setitem(sys.modules, "pandas.io.parquet", pandas_parquet)
+    mocker.patch(
+        "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=object()
+    )
+    return pandas_common, pandas_parquet
 
 
-def test_is_s3_url_rejects_non_str() -> None:
-    assert _is_s3_url(123) is False
+@pytest.mark.parametrize(
+    ("region", "default_region", "expected"),
+    [
+        pytest.param(None, None, "us-east-1", id="fallback"),
+        pytest.param(None, "us-west-2", "us-west-2", id="default-region"),
+        pytest.param("eu-west-1", "us-west-2", "eu-west-1", id="region-wins"),
+    ],
+)
+def test_default_region_prefers_env(
+    set_env: Callable[..., None],
+    region: str | None,
+    default_region: str | None,
+    expected: str,
+) -> None:
+    set_env(AWS_REGION=region, AWS_DEFAULT_REGION=default_region)
+    assert _default_region() == expected
+
+
+@pytest.mark.parametrize(
+    ("creds", "expected"),
+    [
+        pytest.param((None, None, None), ("test", "test", None), id="fallback"),
+        pytest.param(
+            ("key", "secret", "token"), ("key", "secret", "token"), id="from-env"
+        ),
+    ],
+)
+def test_default_creds_prefers_env(
+    set_env: Callable[..., None],
+    creds: tuple[str | None, str | None, str | None],
+    expected: tuple[str, str, str | None],
+) -> None:
+    access_key, secret_key, token = creds
+    set_env(
+        AWS_ACCESS_KEY_ID=access_key,
+        AWS_SECRET_ACCESS_KEY=secret_key,
+        AWS_SESSION_TOKEN=token,
+    )
+    assert _default_creds() == expected
+
+
+@pytest.mark.parametrize(
+    ("mode", "endpoint_url", "expected"),
+    [
+        pytest.param(AutoEndpointMode.DISABLED, None, False, id="disabled"),
+        pytest.param(AutoEndpointMode.FORCE, "http://x", True, id="force"),
+        pytest.param(AutoEndpointMode.IF_MISSING, None, True, id="if-missing-unset"),
+        pytest.param(
+            AutoEndpointMode.IF_MISSING, "http://x", False, id="if-missing-set"
+        ),
+    ],
+)
+def test_should_inject_modes(
+    mode: AutoEndpointMode, endpoint_url: str | None, expected: bool
+) -> None:
+    assert _should_inject(mode, endpoint_url) is expected
 
 
-def test_is_s3_url_accepts_s3_like() -> None:
-    assert _is_s3_url("s3://bucket/key") is True
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        pytest.param(123, False, id="non-str"),
+        pytest.param("s3://bucket/key", True, id="s3-url"),
+    ],
+)
+def test_is_s3_url(path: object, expected: bool) -> None:
+    assert _is_s3_url(path) is expected
 
 
-def test_is_s3_source_handles_sequences() -> None:
-    assert _is_s3_source(["s3://bucket/key"]) is True
-    assert _is_s3_source(["local/file"]) is False
+@pytest.mark.parametrize(
+    ("source", "expected"),
+    [
+        pytest.param(["s3://bucket/key"], True, id="s3-sequence"),
+        pytest.param(["local/file"], False, id="local-sequence"),
+    ],
+)
+def test_is_s3_source_handles_sequences(source: object, expected: bool) -> None:
+    assert _is_s3_source(source) is expected
 
 
 def test_merge_path_style_with_and_without_merge() -> None:
@@ -85,7 +233,23 @@ def test_merge_path_style_with_and_without_merge() -> None:
     assert isinstance(merged, str)
     existing = object()
     assert _merge_path_style(existing) is existing
-    assert _merge_path_style(None) is not None
+    default = _merge_path_style(None)
+    assert default is not None
+    assert _merge_path_style(None) is not default
+
+
+def test_merge_path_style_default_survives_dualstack_client(
+    set_env: Callable[..., None],
+) -> None:
+    set_env(AWS_USE_DUALSTACK_ENDPOINT="true")
+    BotocoreSession().create_client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",  # noqa: S106
+        config=_merge_path_style(None),
+    )
+    assert _merge_path_style(None).s3 == {"addressing_style": "path"}
 
 
 def test_apply_client_defaults_noop_when_disabled() -> None:
@@ -95,13 +259,15 @@ def test_apply_client_defaults_noop_when_disabled() -> None:
 
 
 def test_apply_client_defaults_sets_region_and_creds(
-    monkeypatch: pytest.MonkeyPatch,
+    set_env: Callable[..., None],
 ) -> None:
-    monkeypatch.delenv("AWS_REGION", raising=False)
-    monkeypatch.delenv("AWS_DEFAULT_REGION", raising=False)
-    monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
-    monkeypatch.delenv("AWS_SECRET_ACCESS_KEY", raising=False)
-    monkeypatch.setenv("AWS_SESSION_TOKEN", "token")
+    set_env(
+        AWS_REGION=None,
+        AWS_DEFAULT_REGION=None,
+        AWS_ACCESS_KEY_ID=None,
+        AWS_SECRET_ACCESS_KEY=None,
+        AWS_SESSION_TOKEN="token",  # noqa: S106
+    )
     args: dict[str, object] = {}
     _apply_client_defaults(args, "http://server", AutoEndpointMode.FORCE)
     assert args["endpoint_url"] == "http://server"
@@ -121,22 +287,23 @@ def test_pandas_client_kwargs_returns_none_on_invalid() -> None:
     assert _pandas_client_kwargs({"client_kwargs": "bad"}) is None
 
 
-def test_storage_options_has_endpoint_detects_top_level() -> None:
-    assert _storage_options_has_endpoint({"endpoint_url": "http://example.com"})
-
-
-def test_storage_options_has_endpoint_detects_client_kwargs() -> None:
-    assert _storage_options_has_endpoint(
-        {"client_kwargs": {"endpoint_url": "http://example.com"}}
-    )
-
-
-def test_storage_options_has_endpoint_false_when_missing() -> None:
-    assert not _storage_options_has_endpoint({"anon": False})
-
-
-def test_storage_options_has_endpoint_true_on_invalid_client_kwargs() -> None:
-    assert _storage_options_has_endpoint({"client_kwargs": "bad"})
+@pytest.mark.parametrize(
+    ("storage_options", "expected"),
+    [
+        pytest.param({"endpoint_url": "http://example.com"}, True, id="top-level"),
+        pytest.param(
+            {"client_kwargs": {"endpoint_url": "http://example.com"}},
+            True,
+            id="client-kwargs",
+        ),
+        pytest.param({"anon": False}, False, id="missing"),
+        pytest.param({"client_kwargs": "bad"}, True, id="invalid-client-kwargs"),
+    ],
+)
+def test_storage_options_has_endpoint(
+    storage_options: dict[str, object], expected: bool
+) -> None:
+    assert _storage_options_has_endpoint(storage_options) is expected
 
 
 def test_apply_pandas_storage_options_respects_if_missing() -> None:
@@ -230,15 +397,6 @@ def test_polars_storage_options_has_endpoint_detects_keys() -> None:
     )
 
 
-def test_polars_fsspec_has_endpoint_detects_keys() -> None:
-    assert _polars_fsspec_has_endpoint({"endpoint_url": "http://example.com"})
-    assert _polars_fsspec_has_endpoint(
-        {"client_kwargs": {"endpoint_url": "http://example.com"}}
-    )
-    assert _polars_fsspec_has_endpoint({"client_kwargs": "bad"})
-    assert not _polars_fsspec_has_endpoint({"anon": False})
-
-
 def test_apply_polars_storage_options_respects_if_missing() -> None:
     storage_options = {"endpoint_url": "http://example.com"}
     result = _apply_polars_storage_options(
@@ -320,15 +478,20 @@ def test_apply_polars_fsspec_storage_options_preserves_bad_client_kwargs() -> No
     assert result["client_kwargs"] == "bad"
 
 
-def test_wrap_polars_write_ndjson_noop_for_non_s3() -> None:
+def _make_capturing_original() -> tuple[dict[str, object], Callable[..., str]]:
     called: dict[str, object] = {}
 
     def _original(self: object, file: str | None = None) -> str:
         called["file"] = file
         return "ok"
 
+    return called, _original
+
+
+def test_wrap_polars_write_ndjson_noop_for_non_s3() -> None:
+    called, original = _make_capturing_original()
     wrapped = _wrap_polars_write_ndjson(
-        _original, lambda: ("http://server", AutoEndpointMode.FORCE)
+        original, lambda: ("http://server", AutoEndpointMode.FORCE)
     )
     result = wrapped(object(), file="local/file")
     assert result == "ok"
@@ -336,16 +499,12 @@ def test_wrap_polars_write_ndjson_noop_for_non_s3() -> None:
 
 
 def test_wrap_polars_write_ndjson_respects_disabled_mode(mocker: MockerFixture) -> None:
-    called: dict[str, object] = {}
+    called, original = _make_capturing_original()
     obj = mocker.Mock()
     obj.lazy = mocker.Mock()
 
-    def _original(self: object, file: str | None = None) -> str:
-        called["file"] = file
-        return "ok"
-
     wrapped = _wrap_polars_write_ndjson(
-        _original, lambda: ("http://server", AutoEndpointMode.DISABLED)
+        original, lambda: ("http://server", AutoEndpointMode.DISABLED)
     )
     result = wrapped(obj, "s3://bucket/key")
     assert result == "ok"
@@ -354,14 +513,9 @@ def test_wrap_polars_write_ndjson_respects_disabled_mode(mocker: MockerFixture)
 
 
 def test_wrap_polars_write_ndjson_noop_when_self_missing() -> None:
-    called: dict[str, object] = {}
-
-    def _original(self: object, file: str | None = None) -> str:
-        called["file"] = file
-        return "ok"
-
+    called, original = _make_capturing_original()
     wrapped = _wrap_polars_write_ndjson(
-        _original, lambda: ("http://server", AutoEndpointMode.FORCE)
+        original, lambda: ("http://server", AutoEndpointMode.FORCE)
     )
     result = wrapped(None, "s3://bucket/key")
     assert result == "ok"
@@ -369,9 +523,9 @@ def test_wrap_polars_write_ndjson_noop_when_self_missing() -> None:
 
 
 def test_apply_client_defaults_skips_session_token_when_missing(
-    monkeypatch: pytest.MonkeyPatch,
+    set_env: Callable[..., None],
 ) -> None:
-    monkeypatch.delenv("AWS_SESSION_TOKEN", raising=False)
+    set_env(AWS_SESSION_TOKEN=None)
     args: dict[str, object] = {}
     _apply_client_defaults(args, "http://server", AutoEndpointMode.FORCE)
     assert "aws_session_token" not in args
@@ -388,35 +542,28 @@ def test_apply_client_defaults_respects_existing_creds() -> None:
     assert args["region_name"] == "us-west-1"
 
 
-def test_patcher_stop_noop_when_zero() -> None:
-    patcher = ServerModePatcher()
+def test_patcher_stop_noop_when_zero(patcher: ServerModePatcher) -> None:
     patcher.stop()
 
 
-def test_patch_botocore_double_call() -> None:
-    patcher = ServerModePatcher()
+def test_patch_botocore_double_call(patcher: ServerModePatcher) -> None:
     patcher._patch_botocore()
     patcher._patch_botocore()
-    patcher._restore_botocore()
 
 
-def test_patched_botocore_requires_config() -> None:
-    patcher = ServerModePatcher()
+def test_patched_botocore_requires_config(patcher: ServerModePatcher) -> None:
     patcher._patch_botocore()
-    from botocore.session import Session as BotocoreSession
-
     with pytest.raises(AutoEndpointError, match="auto-endpoint not configured"):
         BotocoreSession().create_client("s3")
-    patcher._restore_botocore()
 
 
-def test_restore_botocore_noop_when_missing() -> None:
-    patcher = ServerModePatcher()
+def test_restore_botocore_noop_when_missing(patcher: ServerModePatcher) -> None:
     patcher._restore_botocore()
 
 
-def test_patch_aiobotocore_skips_when_missing(mocker: MockerFixture) -> None:
-    patcher = ServerModePatcher()
+def test_patch_aiobotocore_skips_when_missing(
+    mocker: MockerFixture, patcher: ServerModePatcher
+) -> None:
     mocker.patch(
         "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=None
     )
@@ -424,32 +571,32 @@ def test_patch_aiobotocore_skips_when_missing(mocker: MockerFixture) -> None:
     assert patcher._original_aio_create is None
 
 
-def test_patch_aiobotocore_noop_when_already_patched() -> None:
-    patcher = ServerModePatcher()
-    patcher._original_aio_create = lambda *args, **kwargs: None
+def test_patch_aiobotocore_noop_when_already_patched(
+    patcher: ServerModePatcher,
+) -> None:
+    method_name = "_create_client"
+    current = getattr(AioSession, method_name)
+    patcher._original_aio_create = current
     patcher._patch_aiobotocore()
+    assert getattr(AioSession, method_name) is current
 
 
 @pytest.mark.asyncio
-async def test_aiobotocore_patched_requires_config() -> None:
-    from aiobotocore.session import AioSession
-
-    patcher = ServerModePatcher()
+async def test_aiobotocore_patched_requires_config(patcher: ServerModePatcher) -> None:
     patcher._patch_aiobotocore()
     method_name = "_create_client"
     create_client = getattr(AioSession(), method_name)
     with pytest.raises(AutoEndpointError, match="auto-endpoint not configured"):
         await create_client("s3")
-    patcher._restore_aiobotocore()
 
 
-def test_restore_aiobotocore_noop_when_missing() -> None:
-    patcher = ServerModePatcher()
+def test_restore_aiobotocore_noop_when_missing(patcher: ServerModePatcher) -> None:
     patcher._restore_aiobotocore()
 
 
-def test_patch_s3fs_skips_when_missing(mocker: MockerFixture) -> None:
-    patcher = ServerModePatcher()
+def test_patch_s3fs_skips_when_missing(
+    mocker: MockerFixture, patcher: ServerModePatcher
+) -> None:
     mocker.patch(
         "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=None
     )
@@ -457,142 +604,66 @@ def test_patch_s3fs_skips_when_missing(mocker: MockerFixture) -> None:
     assert patcher._original_s3fs_init is None
 
 
-def test_patch_s3fs_noop_when_already_patched() -> None:
-    patcher = ServerModePatcher()
-    patcher._original_s3fs_init = lambda *args, **kwargs: None
+def test_patch_s3fs_noop_when_already_patched(
+    fake_s3fs_core: ModuleType, patcher: ServerModePatcher
+) -> None:
+    patcher._original_s3fs_init = _FakeS3FileSystem.__init__
     patcher._patch_s3fs()
+    assert fake_s3fs_core.S3FileSystem.__init__ is _FakeS3FileSystem.__init__
 
 
-def test_restore_s3fs_noop_when_missing() -> None:
-    patcher = ServerModePatcher()
+def test_restore_s3fs_noop_when_missing(patcher: ServerModePatcher) -> None:
     patcher._restore_s3fs()
 
 
 def test_patch_s3fs_injects_defaults(
-    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    fake_s3fs_core: ModuleType, patcher: ServerModePatcher
 ) -> None:
-    class _S3FileSystem:  # noqa: B903
-        def __init__(
-            self,
-            *,
-            endpoint_url: str | None = None,
-            client_kwargs: dict[str, object] | None = None,
-            config_kwargs: dict[str, object] | None = None,
-            use_ssl: bool | None = None,
-        ) -> None:
-            self.endpoint_url = endpoint_url
-            self.client_kwargs = client_kwargs
-            self.config_kwargs = config_kwargs
-            self.use_ssl = use_ssl
-
-    s3fs_module = ModuleType("s3fs")
-    s3fs_core = ModuleType("s3fs.core")
-    attr_name = "S3FileSystem"
-    setattr(s3fs_core, attr_name, _S3FileSystem)
-    monkeypatch.setitem(sys.modules, "s3fs", s3fs_module)
-    monkeypatch.setitem(sys.modules, "s3fs.core", s3fs_core)
-    mocker.patch(
-        "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=object()
-    )
-
-    patcher = ServerModePatcher()
     patcher._endpoint = "http://localhost:5000"
     patcher._mode = AutoEndpointMode.FORCE
     patcher._patch_s3fs()
-    fs = s3fs_core.S3FileSystem()
+    fs = fake_s3fs_core.S3FileSystem()
     assert fs.endpoint_url == "http://localhost:5000"
     assert fs.use_ssl is False
     assert fs.client_kwargs is not None
     assert fs.config_kwargs == {"s3": {"addressing_style": "path"}}
-    patcher._restore_s3fs()
 
 
 def test_patch_s3fs_does_not_override_user_kwargs(
-    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    fake_s3fs_core: ModuleType, patcher: ServerModePatcher
 ) -> None:
-    class _S3FileSystem:  # noqa: B903
-        def __init__(
-            self,
-            *,
-            endpoint_url: str | None = None,
-            client_kwargs: dict[str, object] | None = None,
-            config_kwargs: dict[str, object] | None = None,
-            use_ssl: bool | None = None,
-        ) -> None:
-            self.endpoint_url = endpoint_url
-            self.client_kwargs = client_kwargs
-            self.config_kwargs = config_kwargs
-            self.use_ssl = use_ssl
-
-    s3fs_module = ModuleType("s3fs")
-    s3fs_core = ModuleType("s3fs.core")
-    attr_name = "S3FileSystem"
-    setattr(s3fs_core, attr_name, _S3FileSystem)
-    monkeypatch.setitem(sys.modules, "s3fs", s3fs_module)
-    monkeypatch.setitem(sys.modules, "s3fs.core", s3fs_core)
-    mocker.patch(
-        "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=object()
-    )
-
-    patcher = ServerModePatcher()
     patcher._endpoint = "http://localhost:5000"
     patcher._mode = AutoEndpointMode.FORCE
     patcher._patch_s3fs()
-    fs = s3fs_core.S3FileSystem(client_kwargs={"region_name": "us-east-1"})
+    fs = fake_s3fs_core.S3FileSystem(client_kwargs={"region_name": "us-east-1"})
     assert fs.client_kwargs == {"region_name": "us-east-1"}
-    patcher._restore_s3fs()
 
 
 def test_patch_s3fs_if_missing_respects_user_kwargs(
-    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    fake_s3fs_core: ModuleType, patcher: ServerModePatcher
 ) -> None:
-    class _S3FileSystem:  # noqa: B903
-        def __init__(
-            self,
-            *,
-            anon: bool | None = None,
-            endpoint_url: str | None = None,
-            client_kwargs: dict[str, object] | None = None,
-            config_kwargs: dict[str, object] | None = None,
-            use_ssl: bool | None = None,
-        ) -> None:
-            self.anon = anon
-            self.endpoint_url = endpoint_url
-            self.client_kwargs = client_kwargs
-            self.config_kwargs = config_kwargs
-            self.use_ssl = use_ssl
-
-    s3fs_module = ModuleType("s3fs")
-    s3fs_core = ModuleType("s3fs.core")
-    attr_name = "S3FileSystem"
-    setattr(s3fs_core, attr_name, _S3FileSystem)
-    monkeypatch.setitem(sys.modules, "s3fs", s3fs_module)
-    monkeypatch.setitem(sys.modules, "s3fs.core", s3fs_core)
-    mocker.patch(
-        "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=object()
-    )
-
-    patcher = ServerModePatcher()
     patcher._endpoint = "http://localhost:5000"
     patcher._mode = AutoEndpointMode.IF_MISSING
     patcher._patch_s3fs()
-    fs = s3fs_core.S3FileSystem(anon=True)
+    fs = fake_s3fs_core.S3FileSystem(anon=True)
     assert fs.endpoint_url is None
     assert fs.client_kwargs is None
-    patcher._restore_s3fs()
 
 
-def test_patch_pandas_skips_when_missing(mocker: MockerFixture) -> None:
-    patcher = ServerModePatcher()
+def test_patch_pandas_skips_when_missing(
+    mocker: MockerFixture, patcher: ServerModePatcher
+) -> None:
     mocker.patch(
         "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=None
     )
     patcher._patch_pandas()
+    assert patcher._pandas_targets is None
     assert patcher._original_pandas_get_filepath is None
 
 
-def test_patch_polars_skips_when_missing(mocker: MockerFixture) -> None:
-    patcher = ServerModePatcher()
+def test_patch_polars_skips_when_missing(
+    mocker: MockerFixture, patcher: ServerModePatcher
+) -> None:
     mocker.patch(
         "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=None
     )
@@ -601,12 +672,9 @@ def test_patch_polars_skips_when_missing(mocker: MockerFixture) -> None:
 
 
 def test_polars_modules_skip_when_classes_missing(
-    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    install_polars: _InstallPolars, mocker: MockerFixture
 ) -> None:
-    polars_module = ModuleType("polars")
-    for name, value in {"DataFrame": None, "LazyFrame": object()}.items():
-        setattr(polars_module, name, value)
-    monkeypatch.setitem(sys.modules, "polars", polars_module)
+    install_polars(DataFrame=None, LazyFrame=object())
     mocker.patch(
         "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=object()
     )
@@ -620,18 +688,21 @@ def test_pandas_modules_skip_on_free_threaded(mocker: MockerFixture) -> None:
     find_spec.assert_not_called()
 
 
-def test_pandas_modules_skip_when_fsspec_missing(mocker: MockerFixture) -> None:
-    mocker.patch(
-        "aiomoto.patches.server_mode.importlib.util.find_spec",
-        side_effect=[object(), None],
-    )
-    assert _pandas_modules() is None
-
+@pytest.mark.parametrize(
+    "missing",
+    [
+        pytest.param("fsspec", id="fsspec-missing"),
+        pytest.param("s3fs", id="s3fs-missing"),
+    ],
+)
+def test_pandas_modules_skip_when_dependency_missing(
+    monkeypatch: pytest.MonkeyPatch, missing: str
+) -> None:
+    def _find_spec(name: str) -> object | None:
+        return None if name == missing else object()
 
-def test_pandas_modules_skip_when_s3fs_missing(mocker: MockerFixture) -> None:
-    mocker.patch(
-        "aiomoto.patches.server_mode.importlib.util.find_spec",
-        side_effect=[object(), object(), None],
+    monkeypatch.setattr(
+        "aiomoto.patches.server_mode.importlib.util.find_spec", _find_spec
     )
     assert _pandas_modules() is None
 
@@ -642,48 +713,17 @@ def test_require_server_settings_raises() -> None:
 
 
 def test_patch_pandas_injects_storage_options(
-    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    fake_pandas_io: tuple[ModuleType, ModuleType], patcher: ServerModePatcher
 ) -> None:
     _skip_if_free_threaded()
-    pandas_module = ModuleType("pandas")
-    pandas_io = ModuleType("pandas.io")
-    pandas_common = ModuleType("pandas.io.common")
-    pandas_parquet = ModuleType("pandas.io.parquet")
-
-    def _get_filepath_or_buffer(
-        filepath_or_buffer: object,
-        encoding: str = "utf-8",
-        compression: object | None = None,
-        mode: str = "r",
-        storage_options: dict[str, object] | None = None,
-    ) -> dict[str, object] | None:
-        return storage_options
-
-    def _get_path_or_handle(
-        path_or_handle: object,
-        fs: object | None,
-        mode: str,
-        storage_options: dict[str, object] | None = None,
-    ) -> dict[str, object] | None:
-        return storage_options
-
-    filepath_name = "_get_filepath_or_buffer"
-    path_name = "_get_path_or_handle"
-    setattr(pandas_common, filepath_name, _get_filepath_or_buffer)
-    setattr(pandas_parquet, path_name, _get_path_or_handle)
-    monkeypatch.setitem(sys.modules, "pandas", pandas_module)
-    monkeypatch.setitem(sys.modules, "pandas.io", pandas_io)
-    monkeypatch.setitem(sys.modules, "pandas.io.common", pandas_common)
-    monkeypatch.setitem(sys.modules, "pandas.io.parquet", pandas_parquet)
-    mocker.patch(
-        "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=object()
-    )
+    pandas_common, pandas_parquet = fake_pandas_io
 
-    patcher = ServerModePatcher()
     patcher._endpoint = "http://localhost:5000"
     patcher._mode = AutoEndpointMode.FORCE
     patcher._patch_pandas()
 
+    filepath_name = "_get_filepath_or_buffer"
+    path_name = "_get_path_or_handle"
     get_filepath = getattr(pandas_common, filepath_name)
     get_path = getattr(pandas_parquet, path_name)
     options = get_filepath("s3://bucket/key")
@@ -695,17 +735,19 @@ def test_patch_pandas_injects_storage_options(
     assert untouched is fs_options
 
     patcher._restore_pandas()
+    assert getattr(pandas_common, filepath_name) is _fake_get_filepath_or_buffer
+    assert getattr(pandas_parquet, path_name) is _fake_get_path_or_handle
+    assert patcher._pandas_targets is None
 
 
 def test_patch_polars_injects_storage_options(
-    monkeypatch: pytest.MonkeyPatch, mocker: MockerFixture
+    install_polars: _InstallPolars, mocker: MockerFixture, patcher: ServerModePatcher
 ) -> None:
     if sys.version_info >= (3, 14):  # pragma: no cover
         pytest.skip(  # pragma: no cover
             "Polars does not declare Python 3.14 support yet; "
             "https://github.com/pola-rs/polars/issues/25035"
         )
-    polars_module = ModuleType("polars")
 
     def _read_parquet(
         *, source: object, storage_options: dict[str, object] | None = None
@@ -743,18 +785,13 @@ def test_patch_polars_injects_storage_options(
     df_local = _DataFrame()
     assert df_local.write_ndjson() is None
 
-    for name, value in {
-        "read_parquet": _read_parquet,
-        "DataFrame": _DataFrame,
-        "LazyFrame": _LazyFrame,
-    }.items():
-        setattr(polars_module, name, value)
-    monkeypatch.setitem(sys.modules, "polars", polars_module)
+    polars_module = install_polars(
+        read_parquet=_read_parquet, DataFrame=_DataFrame, LazyFrame=_LazyFrame
+    )
     mocker.patch(
         "aiomoto.patches.server_mode.importlib.util.find_spec", return_value=object()
     )
 
-    patcher = ServerModePatcher()
     patcher._endpoint = "http://localhost:5000"
     patcher._mode = AutoEndpointMode.FORCE
     patcher._patch_polars()
@@ -775,24 +812,23 @@ def test_patch_polars_injects_storage_options(
     assert storage_options is not None
     assert storage_options["endpoint_url"] == "http://localhost:5000"
 
-    patcher._restore_polars()
 
-
-def test_patch_polars_noop_when_already_patched() -> None:
-    patcher = ServerModePatcher()
+def test_patch_polars_noop_when_already_patched(
+    install_polars: _InstallPolars, patcher: ServerModePatcher
+) -> None:
+    install_polars()
     patcher._original_polars_functions = {}
     patcher._patch_polars()
     assert patcher._original_polars_functions == {}
 
 
-def test_restore_polars_noop_when_missing() -> None:
-    patcher = ServerModePatcher()
+def test_restore_polars_noop_when_missing(patcher: ServerModePatcher) -> None:
     patcher._restore_polars()
 
 
-def test_restore_polars_restores_methods(monkeypatch: pytest.MonkeyPatch) -> None:
-    polars_module = ModuleType("polars")
-
+def test_restore_polars_restores_methods(
+    install_polars: _InstallPolars, patcher: ServerModePatcher
+) -> None:
     class _DataFrame:
         def write_parquet(self) -> None:
             return None
@@ -806,11 +842,7 @@ def test_restore_polars_restores_methods(monkeypatch: pytest.MonkeyPatch) -> Non
     lazy_local = _LazyFrame()
     assert lazy_local.sink_parquet() is None
 
-    for name, value in {"DataFrame": _DataFrame, "LazyFrame": _LazyFrame}.items():
-        setattr(polars_module, name, value)
-    monkeypatch.setitem(sys.modules, "polars", polars_module)
-
-    patcher = ServerModePatcher()
+    polars_module = install_polars(DataFrame=_DataFrame, LazyFrame=_LazyFrame)
 
     def _original_read() -> None:
         return None
@@ -833,13 +865,10 @@ def test_restore_polars_restores_methods(monkeypatch: pytest.MonkeyPatch) -> Non
     assert polars_module.LazyFrame.sink_parquet is _original_lazy
 
 
-def test_restore_polars_skips_missing_methods(monkeypatch: pytest.MonkeyPatch) -> None:
-    polars_module = ModuleType("polars")
-    for name, value in {"DataFrame": object(), "LazyFrame": object()}.items():
-        setattr(polars_module, name, value)
-    monkeypatch.setitem(sys.modules, "polars", polars_module)
-
-    patcher = ServerModePatcher()
+def test_restore_polars_skips_missing_methods(
+    install_polars: _InstallPolars, patcher: ServerModePatcher
+) -> None:
+    install_polars(DataFrame=object(), LazyFrame=object())
 
     def _original_read() -> None:
         return None
@@ -852,25 +881,43 @@ def test_restore_polars_skips_missing_methods(monkeypatch: pytest.MonkeyPatch) -
     patcher._restore_polars()
 
 
-def test_patch_pandas_noop_when_already_patched() -> None:
-    patcher = ServerModePatcher()
+def test_patch_pandas_noop_when_already_patched(
+    fake_pandas_io: tuple[ModuleType, ModuleType], patcher: ServerModePatcher
+) -> None:
+    patcher._pandas_targets = fake_pandas_io
+    patcher._original_pandas_get_filepath = _fake_get_filepath_or_buffer
+    patcher._original_pandas_get_path = _fake_get_path_or_handle
+    patcher._patch_pandas()
+    pandas_common, pandas_parquet = fake_pandas_io
+    filepath_name = "_get_filepath_or_buffer"
+    path_name = "_get_path_or_handle"
+    assert getattr(pandas_common, filepath_name) is _fake_get_filepath_or_buffer
+    assert getattr(pandas_parquet, path_name) is _fake_get_path_or_handle
 
-    def _noop(*args: object, **kwargs: object) -> None:
-        return None
 
-    patcher._original_pandas_get_filepath = _noop
-    patcher._patch_pandas()
-    assert _noop() is None
+def test_patch_pandas_failure_leaves_patcher_unpatched(
+    fake_pandas_io: tuple[ModuleType, ModuleType],
+    monkeypatch: pytest.MonkeyPatch,
+    patcher: ServerModePatcher,
+) -> None:
+    _skip_if_free_threaded()
+    pandas_common, pandas_parquet = fake_pandas_io
+    monkeypatch.delattr(pandas_parquet, "_get_path_or_handle")
+    with pytest.raises(AttributeError):
+        patcher._patch_pandas()
+    assert patcher._pandas_targets is None
+    patcher._restore_pandas()
+    filepath_name = "_get_filepath_or_buffer"
+    assert getattr(pandas_common, filepath_name) is _fake_get_filepath_or_buffer
 
 
 def test_skip_if_free_threaded_skips(mocker: MockerFixture) -> None:
-    mocker.patch("sysconfig.get_config_var", return_value=1)
+    mocker.patch.object(sys.modules[__name__], "_FREE_THREADED", new=True)
     with pytest.raises(pytest.skip.Exception):
         _skip_if_free_threaded()
 
 
-def test_restore_pandas_noop_when_missing() -> None:
-    patcher = ServerModePatcher()
+def test_restore_pandas_noop_when_missing(patcher: ServerModePatcher) -> None:
     patcher._restore_pandas()
 
 
@@ -892,7 +939,7 @@ def test_wrap_pandas_get_filepath_injects_storage_options() -> None:
     assert result["endpoint_url"] == "http://server"
 
 
-def test_wrap_pandas_get_filepath_noop_for_non_s3() -> None:
+def test_wrap_pandas_get_filepath_noop_for_non_s3(mocker: MockerFixture) -> None:
     def _original(
         filepath_or_buffer: object,
         *args: object,
@@ -901,11 +948,10 @@ def test_wrap_pandas_get_filepath_noop_for_non_s3() -> None:
     ) -> dict[str, object] | None:
         return storage_options
 
-    def _get_settings() -> tuple[str, AutoEndpointMode]:
-        return ("http://server", AutoEndpointMode.FORCE)
-
-    wrapper = _wrap_pandas_get_filepath(_original, _get_settings)
+    get_settings = mocker.Mock(return_value=("http://server", AutoEndpointMode.FORCE))
+    wrapper = _wrap_pandas_get_filepath(_original, get_settings)
     assert wrapper("file:///local/data.csv") is None
+    get_settings.assert_not_called()
 
 
 def test_wrap_pandas_get_path_injects_storage_options() -> None:
@@ -928,7 +974,7 @@ def test_wrap_pandas_get_path_injects_storage_options() -> None:
     assert result["endpoint_url"] == "http://server"
 
 
-def test_wrap_pandas_get_path_noop_for_non_s3() -> None:
+def test_wrap_pandas_get_path_noop_for_non_s3(mocker: MockerFixture) -> None:
     def _original(
         path_or_handle: object,
         fs: object | None,
@@ -939,9 +985,8 @@ def test_wrap_pandas_get_path_noop_for_non_s3() -> None:
     ) -> dict[str, object] | None:
         return storage_options
 
-    def _get_settings() -> tuple[str, AutoEndpointMode]:
-        return ("http://server", AutoEndpointMode.FORCE)
-
-    wrapper = _wrap_pandas_get_path(_original, _get_settings)
+    get_settings = mocker.Mock(return_value=("http://server", AutoEndpointMode.FORCE))
+    wrapper = _wrap_pandas_get_path(_original, get_settings)
     options: dict[str, object] = {"client_kwargs": {"endpoint_url": "http://keep"}}
     assert wrapper("data.csv", None, "rb", storage_options=options) is options
+    get_settings.assert_not_called()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from uuid import uuid4
+import asyncio
+from operator import itemgetter
 
 import aioboto3
 import pytest
@@ -11,16 +12,14 @@ from aiomoto import mock_aws
 REGION = "us-east-1"
 ACCOUNT_ID = "123456789012"
 
-
-def _session() -> aioboto3.Session:
-    return aioboto3.Session()
+_SESSION = aioboto3.Session()
 
 
 @pytest.mark.asyncio
 async def test_create_and_delete_topic_async() -> None:
-    topic_name = f"topic-{uuid4().hex[:6]}"
+    topic_name = "test-topic"
     with mock_aws():
-        async with _session().client("sns", region_name=REGION) as sns:
+        async with _SESSION.client("sns", region_name=REGION) as sns:
             await sns.create_topic(Name=topic_name)
             topics = (await sns.list_topics())["Topics"]
             assert len(topics) == 1
@@ -36,9 +35,9 @@ async def test_create_and_delete_topic_async() -> None:
 
 @pytest.mark.asyncio
 async def test_topic_attributes_and_tags_async() -> None:
-    topic_name = f"topic-{uuid4().hex[:6]}"
+    topic_name = "test-topic"
     with mock_aws():
-        async with _session().client("sns", region_name=REGION) as sns:
+        async with _SESSION.client("sns", region_name=REGION) as sns:
             topic_arn = (
                 await sns.create_topic(
                     Name=topic_name,
@@ -54,21 +53,23 @@ async def test_topic_attributes_and_tags_async() -> None:
             tags = (await sns.list_tags_for_resource(ResourceArn=topic_arn))["Tags"]
 
     assert attrs["DisplayName"] == "test-topic"
-    assert {tuple(t.items()) for t in tags} == {
-        (("Key", "env"), ("Value", "dev")),
-        (("Key", "owner"), ("Value", "aiomoto")),
-    }
+    assert sorted(tags, key=itemgetter("Key")) == [
+        {"Key": "env", "Value": "dev"},
+        {"Key": "owner", "Value": "aiomoto"},
+    ]
 
 
 @pytest.mark.asyncio
 async def test_publish_to_sqs_raw_async() -> None:
     with mock_aws():
         async with (
-            _session().resource("sns", region_name=REGION) as sns_res,
-            _session().resource("sqs", region_name=REGION) as sqs_res,
+            _SESSION.resource("sns", region_name=REGION) as sns_res,
+            _SESSION.resource("sqs", region_name=REGION) as sqs_res,
         ):
-            topic = await sns_res.create_topic(Name="some-topic")
-            queue = await sqs_res.create_queue(QueueName="test-queue")
+            topic, queue = await asyncio.gather(
+                sns_res.create_topic(Name="some-topic"),
+                sqs_res.create_queue(QueueName="test-queue"),
+            )
 
             queue_arn = (await queue.attributes)["QueueArn"]
             subscription = await topic.subscribe(Protocol="sqs", Endpoint=queue_arn)
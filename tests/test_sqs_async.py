@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import json
-from uuid import uuid4
 
 import aioboto3
 import pytest
@@ -11,16 +10,14 @@ from aiomoto import mock_aws
 
 REGION = "us-east-1"
 
-
-def _session() -> aioboto3.Session:
-    return aioboto3.Session()
+_SESSION = aioboto3.Session()
 
 
 @pytest.mark.asyncio
 async def test_create_queue_and_attributes_async() -> None:
-    q_name = f"q-{uuid4().hex[:8]}"
+    q_name = "test-queue"
     with mock_aws():
-        async with _session().client("sqs", region_name=REGION) as sqs:
+        async with _SESSION.client("sqs", region_name=REGION) as sqs:
             queue_url = (await sqs.create_queue(QueueName=q_name, Attributes={}))[
                 "QueueUrl"
             ]
@@ -39,9 +36,9 @@ async def test_create_queue_and_attributes_async() -> None:
 
 @pytest.mark.asyncio
 async def test_send_receive_delete_message_async() -> None:
-    q_name = f"q-{uuid4().hex[:8]}"
+    q_name = "test-queue"
     with mock_aws():
-        async with _session().resource("sqs", region_name=REGION) as sqs:
+        async with _SESSION.resource("sqs", region_name=REGION) as sqs:
             queue = await sqs.create_queue(QueueName=q_name)
             send_resp = await queue.send_message(MessageBody="hello", DelaySeconds=0)
 
@@ -63,14 +60,14 @@ async def test_send_receive_delete_message_async() -> None:
 
 @pytest.mark.asyncio
 async def test_create_queue_with_tags_and_policy_async() -> None:
-    q_name = f"q-{uuid4().hex[:8]}"
+    q_name = "test-queue"
     policy = {
         "Version": "2012-10-17",
         "Id": "test",
         "Statement": [{"Effect": "Allow", "Principal": "*", "Action": "*"}],
     }
     with mock_aws():
-        async with _session().client("sqs", region_name=REGION) as sqs:
+        async with _SESSION.client("sqs", region_name=REGION) as sqs:
             queue_url = (
                 await sqs.create_queue(
                     QueueName=q_name,
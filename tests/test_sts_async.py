@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 import json
 
@@ -20,15 +21,49 @@ REGION_PARTITIONS = [
     ("us-isob-east-1", "aws-iso-b"),
 ]
 
+_TRUST_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": {
+            "Effect": "Allow",
+            "Principal": {"AWS": f"arn:aws:iam::{ACCOUNT_ID}:root"},
+            "Action": "sts:AssumeRole",
+        },
+    }
+)
+
+_LONG_FEDERATION_POLICY = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": ["s3:*"],
+                "Resource": (
+                    "arn:aws:s3:::yyyy-xxxxx-cloud-default/"
+                    f"my_default_folder/folder-name-{num}/*"
+                ),
+            }
+            for num in range(30)
+        ],
+    }
+)
+
+
+_SESSION = aioboto3.Session()
+
 
-def _session() -> aioboto3.Session:
-    return aioboto3.Session()
+@pytest.fixture
+def frozen_time() -> Iterator[None]:
+    with freeze_time("2012-01-01 12:00:00", real_asyncio=True):
+        yield
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("frozen_time")
 async def test_get_session_token_async() -> None:
-    with freeze_time("2012-01-01 12:00:00", real_asyncio=True), mock_aws():
-        async with _session().client("sts", region_name="us-east-1") as sts:
+    with mock_aws():
+        async with _SESSION.client("sts", region_name="us-east-1") as sts:
             creds = (await sts.get_session_token(DurationSeconds=903))["Credentials"]
 
     assert isinstance(creds["Expiration"], datetime)
@@ -46,10 +81,11 @@ async def test_get_session_token_async() -> None:
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("frozen_time")
 async def test_get_federation_token_async() -> None:
     federated_user_name = "sts-user"
-    with freeze_time("2012-01-01 12:00:00", real_asyncio=True), mock_aws():
-        async with _session().client("sts", region_name="us-east-1") as sts:
+    with mock_aws():
+        async with _SESSION.client("sts", region_name="us-east-1") as sts:
             fed_token = await sts.get_federation_token(
                 DurationSeconds=903, Name=federated_user_name
             )
@@ -77,28 +113,20 @@ async def test_get_federation_token_async() -> None:
 
 
 @pytest.mark.asyncio
+@pytest.mark.usefixtures("frozen_time")
 @pytest.mark.parametrize(("region", "partition"), REGION_PARTITIONS)
 async def test_assume_role_async(region: str, partition: str) -> None:
-    with freeze_time("2012-01-01 12:00:00", real_asyncio=True), mock_aws():
-        async with _session().client("iam", region_name=region) as iam:
-            trust_policy_document = {
-                "Version": "2012-10-17",
-                "Statement": {
-                    "Effect": "Allow",
-                    "Principal": {"AWS": f"arn:aws:iam::{ACCOUNT_ID}:root"},
-                    "Action": "sts:AssumeRole",
-                },
-            }
+    with mock_aws():
+        async with _SESSION.client("iam", region_name=region) as iam:
             role = (
                 await iam.create_role(
-                    RoleName="test-role",
-                    AssumeRolePolicyDocument=json.dumps(trust_policy_document),
+                    RoleName="test-role", AssumeRolePolicyDocument=_TRUST_POLICY
                 )
             )["Role"]
             role_arn = role["Arn"]
             role_id = role["RoleId"]
 
-        async with _session().client("sts", region_name=region) as sts:
+        async with _SESSION.client("sts", region_name=region) as sts:
             assume_role_response = await sts.assume_role(
                 RoleArn=role_arn,
                 RoleSessionName="session-name",
@@ -137,23 +165,14 @@ async def test_assume_role_async(region: str, partition: str) -> None:
 @pytest.mark.asyncio
 async def test_assume_role_with_too_long_role_session_name_async() -> None:
     with mock_aws():
-        async with _session().client("iam", region_name="us-east-1") as iam:
-            trust_policy_document = {
-                "Version": "2012-10-17",
-                "Statement": {
-                    "Effect": "Allow",
-                    "Principal": {"AWS": f"arn:aws:iam::{ACCOUNT_ID}:root"},
-                    "Action": "sts:AssumeRole",
-                },
-            }
+        async with _SESSION.client("iam", region_name="us-east-1") as iam:
             role_arn = (
                 await iam.create_role(
-                    RoleName="test-role",
-                    AssumeRolePolicyDocument=json.dumps(trust_policy_document),
+                    RoleName="test-role", AssumeRolePolicyDocument=_TRUST_POLICY
                 )
             )["Role"]["Arn"]
 
-        async with _session().client("sts", region_name="us-east-1") as sts:
+        async with _SESSION.client("sts", region_name="us-east-1") as sts:
             session_name = "s" * 65
             with pytest.raises(ClientError) as ex:  # pragma: no branch
                 await sts.assume_role(
@@ -173,7 +192,7 @@ async def test_get_caller_identity_with_default_credentials_async(
     region: str, partition: str
 ) -> None:
     with mock_aws():
-        async with _session().client("sts", region_name=region) as sts:
+        async with _SESSION.client("sts", region_name=region) as sts:
             identity = await sts.get_caller_identity()
 
     assert identity["Arn"] == f"arn:{partition}:sts::{ACCOUNT_ID}:user/moto"
@@ -189,11 +208,11 @@ async def test_get_caller_identity_with_iam_user_credentials_async(
     region: str, partition: str
 ) -> None:
     with mock_aws():
-        async with _session().client("iam", region_name=region) as iam:
+        async with _SESSION.client("iam", region_name=region) as iam:
             iam_user = (await iam.create_user(UserName="new-user"))["User"]
             access_key = (await iam.create_access_key(UserName="new-user"))["AccessKey"]
 
-        async with _session().client(
+        async with _SESSION.client(
             "sts",
             region_name=region,
             aws_access_key_id=access_key["AccessKeyId"],
@@ -214,29 +233,20 @@ async def test_get_caller_identity_with_assumed_role_credentials_async(
     region: str, partition: str
 ) -> None:
     with mock_aws():
-        async with _session().client("iam", region_name=region) as iam:
-            trust_policy_document = {
-                "Version": "2012-10-17",
-                "Statement": {
-                    "Effect": "Allow",
-                    "Principal": {"AWS": f"arn:aws:iam::{ACCOUNT_ID}:root"},
-                    "Action": "sts:AssumeRole",
-                },
-            }
+        async with _SESSION.client("iam", region_name=region) as iam:
             iam_role_arn = (
                 await iam.create_role(
-                    RoleName="new-user",
-                    AssumeRolePolicyDocument=json.dumps(trust_policy_document),
+                    RoleName="new-user", AssumeRolePolicyDocument=_TRUST_POLICY
                 )
             )["Role"]["Arn"]
 
-        async with _session().client("sts", region_name=region) as sts:
+        async with _SESSION.client("sts", region_name=region) as sts:
             assumed_role = await sts.assume_role(
                 RoleArn=iam_role_arn, RoleSessionName="new-session"
             )
             access_key = assumed_role["Credentials"]
 
-        async with _session().client(
+        async with _SESSION.client(
             "sts",
             region_name=region,
             aws_access_key_id=access_key["AccessKeyId"],
@@ -252,25 +262,12 @@ async def test_get_caller_identity_with_assumed_role_credentials_async(
 @pytest.mark.asyncio
 async def test_federation_token_with_too_long_policy_async() -> None:
     with mock_aws():
-        async with _session().client("sts", region_name="us-east-1") as sts:
-            resource_tmpl = (
-                "arn:aws:s3:::yyyy-xxxxx-cloud-default/"
-                "my_default_folder/folder-name-%s/*"
-            )
-            statements = [
-                {
-                    "Effect": "Allow",
-                    "Action": ["s3:*"],
-                    "Resource": resource_tmpl % str(num),
-                }
-                for num in range(30)
-            ]
-            json_policy = json.dumps({"Version": "2012-10-17", "Statement": statements})
-            assert len(json_policy) > MAX_FEDERATION_TOKEN_POLICY_LENGTH
+        async with _SESSION.client("sts", region_name="us-east-1") as sts:
+            assert len(_LONG_FEDERATION_POLICY) > MAX_FEDERATION_TOKEN_POLICY_LENGTH
 
             with pytest.raises(ClientError) as ex:  # pragma: no branch
                 await sts.get_federation_token(
-                    Name="foo", DurationSeconds=3600, Policy=json_policy
+                    Name="foo", DurationSeconds=3600, Policy=_LONG_FEDERATION_POLICY
                 )
 
     assert ex.value.response["Error"]["Code"] == "ValidationError"